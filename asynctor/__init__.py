@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from .aio import bulk_gather, gather, map_group, run, run_async, start_tasks, wait_for
-from .client import AsyncRedis
 from .timing import timeit
 from .utils import AsyncClientGenerator, AsyncTestClient, AttrDict, cache_attr
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import AsyncRedis
+
 __version__ = "0.6.9"
 __all__ = (
     "__version__",
@@ -20,3 +24,12 @@ __all__ = (
     "timeit",
     "wait_for",
 )
+
+
+def __getattr__(name: str):
+    # Importing redis is slow, so only do it when `AsyncRedis` is used
+    if name == "AsyncRedis":
+        from .client import AsyncRedis
+
+        return AsyncRedis
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
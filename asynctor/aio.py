@@ -1,17 +1,13 @@
 from __future__ import annotations
 
-import itertools
+import functools
+import math
+import os
 import sys
 import warnings
-from collections.abc import (
-    Awaitable,
-    Callable,
-    Coroutine,
-    Generator,
-    Iterable,
-    Sequence,
-)
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Sized
 from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from typing import Any, TypeVar
 
 import anyio
@@ -28,6 +24,12 @@ else:
 T_Retval = TypeVar("T_Retval")
 PosArgsT = TypeVarTuple("PosArgsT")
 AsyncFunc = Callable[..., Coroutine]
+# Let `run` use uvloop by default if it's installed
+_USE_UVLOOP = find_spec("uvloop") is not None and not os.getenv("ASYNCTOR_NO_UVLOOP")
+
+
+async def _await_coro(coro: Awaitable[T_Retval]) -> T_Retval:
+    return await coro
 
 
 def ensure_afunc(
@@ -36,11 +38,7 @@ def ensure_afunc(
     """Wrap coroutine to be async function"""
     if callable(coro):
         return coro
-
-    async def do_await():
-        return await coro
-
-    return do_await
+    return functools.partial(_await_coro, coro)
 
 
 def run_async(
@@ -74,7 +72,9 @@ def run(
     :param func: async function or coroutine.
     :param args: arguments that will pass to `func` if it's a function.
     :param backend: should be 'asyncio' or 'trio'.
-    :param backend_options: will pass to `anyio.run`.
+    :param backend_options: will pass to `anyio.run`, if it's None and uvloop
+        is installed, `{"use_uvloop": True}` will be used for asyncio backend
+        (set environment variable `ASYNCTOR_NO_UVLOOP=1` to disable it).
 
     Usage::
 
@@ -90,92 +90,83 @@ def run(
         assert result_asyncio_format == result_anyio_format
 
     """
+    if backend_options is None and backend == "asyncio" and _USE_UVLOOP:
+        backend_options = {"use_uvloop": True}
     if not callable(func):
+        return anyio.run(
+            _await_coro, func, backend=backend, backend_options=backend_options
+        )
+    return anyio.run(func, *args, backend=backend, backend_options=backend_options)
 
-        async def do_await() -> T_Retval:
-            return await func
 
-        return anyio.run(do_await, backend=backend, backend_options=backend_options)
-    return anyio.run(func, *args, backend=backend, backend_options=backend_options)
+async def _runner(results: list, index: int, coro: Coroutine) -> None:
+    results[index] = await coro
+
+
+async def _limited_runner(
+    limiter: anyio.Semaphore, results: list, index: int, coro: Coroutine
+) -> None:
+    async with limiter:
+        results[index] = await coro
 
 
 async def bulk_gather(
-    coros: Sequence[Coroutine] | Generator[Coroutine, None, None],
+    coros: Iterable[Coroutine],
     batch_size=0,
     wait_last=False,
     raises=True,
     *,
     limit: int | None = None,
 ) -> tuple:
-    """Similar like `asyncio.gather`, if batch_size is not zero, running tasks will CapacityLimiter({batch_size}).
+    """Similar like `asyncio.gather`, if batch_size is not zero, running tasks will be limited by Semaphore({batch_size}).
 
     :param coros: Coroutines
     :param batch_size: running tasks limit number, set 0 to be unlimit.
-    :param wait_last: if True, wait last bulk tasks to complete then start new task group,
-        else use anyio.CapacityLimiter to limit task number.
+    :param wait_last: (deprecated) no longer makes difference, tasks are always run
+        in a pool of `batch_size` workers.
     :param raises: if True, raise Exception when coroutine failed, else return None.
     :param limit: (deprecated) only leave it here to compare with old version.
     """
-    try:
-        total = len(coros)  # type:ignore[arg-type]
-    except TypeError:  # if coros is generator
-        total = 0
-    else:
-        if total == 0:
-            return ()
-    results = [None] * total
-
-    async def runner(_i: int, _coro: Coroutine) -> None:
-        results[_i] = await _coro
-
-    async def limited_runner(_i, _coro, _limiter) -> None:
-        async with _limiter:
-            results[_i] = await _coro
-
-    try:
-        if limit is not None:
-            if batch_size:
-                if batch_size != limit:
-                    raise ParamsError(f"Conflict value with {limit=} & {batch_size=}")
-                else:
-                    warnings.warn(
-                        "`limit` is deprecated, it's replaced by `batch_size`, feel free to keep only one.",
-                        DeprecationWarning,
-                        stacklevel=2,
-                    )
-            else:
-                batch_size = limit
+    if wait_last:
+        warnings.warn(
+            "`wait_last` is deprecated, tasks are always run in a pool of `batch_size` workers.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    if not isinstance(coros, Sized):  # if coros is generator
+        coros = list(coros)
+    total = len(coros)
+    if total == 0:
+        return ()
+    if limit is not None:
         if batch_size:
-            if wait_last:
-                if total == 0:
-                    todos: list[tuple[int, Coroutine]] = []
-                    for count, args in zip(itertools.count(), enumerate(coros)):
-                        todos.append(args)
-                        results.append(None)
-                        if count % batch_size == 0:
-                            await map_group(runner, todos)
-                            todos.clear()
-                    if todos:
-                        await map_group(runner, todos)
-                else:
-                    for start in range(0, total, batch_size):
-                        coros_slice = itertools.islice(coros, start, start + batch_size)
-                        args_items = (
-                            (start + i, coro) for i, coro in enumerate(coros_slice)
-                        )
-                        await map_group(runner, args_items)
+            if batch_size != limit:
+                raise ParamsError(f"Conflict value with {limit=} & {batch_size=}")
             else:
-                limiter = anyio.CapacityLimiter(batch_size)
-                todo_args = ((*item, limiter) for item in enumerate(coros))
-                if total == 0:
-                    await map_group(limited_runner, todo_args, results)
-                else:
-                    await map_group(limited_runner, todo_args)
+                warnings.warn(
+                    "`limit` is deprecated, it's replaced by `batch_size`, feel free to keep only one.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
         else:
-            if total == 0:
-                await map_group(runner, enumerate(coros), results)
-            else:
-                await map_group(runner, enumerate(coros))
+            batch_size = limit
+    results = [None] * total
+    runner: Callable[[int, Coroutine], Awaitable[None]]
+    if batch_size:
+        # Keep `batch_size` coroutines in flight, start a new one as soon as
+        # any running one finished, so that a slow one will not stall others.
+        # Semaphore is enough here and cheaper than CapacityLimiter, which
+        # tracks the borrower task on every acquire/release.
+        limiter = anyio.Semaphore(batch_size)
+        runner = functools.partial(_limited_runner, limiter, results)
+    else:
+        runner = functools.partial(_runner, results)
+    try:
+        # Use only one task group for all the coroutines
+        async with anyio.create_task_group() as tg:
+            start = tg.start_soon
+            for i, coro in enumerate(coros):
+                start(runner, i, coro)
     except ExceptionGroup as e:
         if raises:
             raise e.exceptions[0] from e
@@ -201,10 +192,18 @@ async def map_group(
     it
     """
     async with anyio.create_task_group() as tg:
+        start = tg.start_soon
+        if results is not None:
+            if isinstance(todos, Sized):
+                results.extend([None] * len(todos))
+            else:
+                append = results.append
+                for args in todos:
+                    append(None)
+                    start(func, *args)
+                return
         for args in todos:
-            if results is not None:
-                results.append(None)
-            tg.start_soon(func, *args)
+            start(func, *args)
 
 
 async def gather(*coros: Coroutine) -> tuple:
@@ -231,9 +230,11 @@ async def start_tasks(coro: Coroutine | Callable, *more: Coroutine | Callable):
     """
     async with anyio.create_task_group() as tg:
         with anyio.CancelScope(shield=True):
-            tg.start_soon(ensure_afunc(coro))
-            for c in more:
-                tg.start_soon(ensure_afunc(c))
+            for c in (coro, *more):
+                if callable(c):
+                    tg.start_soon(c)
+                else:
+                    tg.start_soon(_await_coro, c)
             try:
                 yield
             finally:
@@ -241,8 +242,13 @@ async def start_tasks(coro: Coroutine | Callable, *more: Coroutine | Callable):
 
 
 async def wait_for(
-    coro: Coroutine[None, None, T_Retval], timeout: int | float
+    coro: Coroutine[None, None, T_Retval], timeout: int | float | None
 ) -> T_Retval:
-    """Similar like asyncio.wait_for"""
+    """Similar like asyncio.wait_for
+
+    :param timeout: seconds to wait, None or math.inf means wait without cancel scope.
+    """
+    if timeout is None or timeout == math.inf:
+        return await coro
     with anyio.fail_after(timeout):
         return await coro
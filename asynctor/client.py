@@ -1,5 +1,4 @@
 import os
-from contextlib import AbstractAsyncContextManager
 from typing import TYPE_CHECKING
 
 from redis import asyncio as aioredis
@@ -8,14 +7,42 @@ if TYPE_CHECKING:  # pragma: no cover
     from fastapi import FastAPI, Request
 
 
-# The `RedisClient` class is a subclass of `aioredis.Redis` and `AbstractAsyncContextManager` that
-# initializes a Redis client with a host parameter from an environment variable if not provided, and
-# implements an asynchronous exit method to close the client.
-class RedisClient(aioredis.Redis, AbstractAsyncContextManager):
+def _parse_max_connections(value: "str | None") -> "int | None":
+    if not value:
+        return None
+    if not value.isdigit() or (number := int(value)) <= 0:
+        raise ValueError(
+            f"REDIS_MAX_CONNECTIONS must be a positive integer, got {value!r}"
+        )
+    return number
+
+
+# Upper bound of connections in the pool of each client, unlimited by default
+_REDIS_MAX_CONNECTIONS = _parse_max_connections(os.getenv("REDIS_MAX_CONNECTIONS"))
+
+
+# The `RedisClient` class is a subclass of `aioredis.Redis` that initializes a Redis client with a
+# host parameter from an environment variable if not provided, and implements an asynchronous exit
+# method to close the client.
+class RedisClient(aioredis.Redis):
     def __init__(self, **kw) -> None:
         if "host" not in kw and (host := os.getenv("REDIS_HOST")):
             kw["host"] = host
         super().__init__(**kw)
+        if (
+            _REDIS_MAX_CONNECTIONS is not None
+            and "max_connections" not in kw
+            and "connection_pool" not in kw
+        ):
+            # The default pool raises `MaxConnectionsError` when it is exhausted,
+            # while a blocking one waits for a connection to be released (20s at most).
+            # No connection has been made yet, so the default pool can be replaced.
+            pool = self.connection_pool
+            self.connection_pool = aioredis.BlockingConnectionPool(
+                max_connections=_REDIS_MAX_CONNECTIONS,
+                connection_class=pool.connection_class,
+                **pool.connection_kwargs,
+            )
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
         await self.aclose()  # type:ignore[attr-defined]
@@ -47,16 +74,20 @@ class AsyncRedis(RedisClient):
     def __new__(
         cls, app: "FastAPI | Request | str | None" = None, check_connection=True, **kw
     ) -> "AsyncRedis":
-        if (
-            app is not None
-            and (app := getattr(app, "app", None))
-            and (state := getattr(app, "state", None))
-        ):
+        if app is None or isinstance(app, str):
+            return super().__new__(cls)
+        try:
             # isinstance(app, Request)
-            return state.redis
-        return super().__new__(cls)
+            state = app.app.state  # type:ignore[union-attr]
+        except AttributeError:
+            # isinstance(app, FastAPI)
+            return super().__new__(cls)
+        return state.redis
 
     def __init__(self, app=None, check_connection=True, **kw) -> None:
+        if hasattr(self, "_check_connection"):
+            # Already initialized instance that `__new__` got from app.state
+            return
         if isinstance(app, str):
             kw.setdefault("host", app)
             app = None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import concurrent.futures
-import functools
+import reprlib
 import sys
 from collections.abc import Callable
 from contextlib import AbstractContextManager
@@ -93,17 +93,26 @@ class ThreadGroup(AbstractContextManager):
         ```
         """
 
-        @functools.wraps(func)
-        def runner(*args: T_ParamSpec.args, **kwargs: T_ParamSpec.kwargs) -> None:
-            if self._executor is not None:
-                fut = self._executor.submit(func, *args, **kwargs)
-                self._future_idx[fut] = len(self._future_idx)
+        threads = self._threads
+
+        def start_thread(*args: T_ParamSpec.args, **kwargs: T_ParamSpec.kwargs) -> None:
+            t = StoredThread(target=func, args=args, kwargs=kwargs)
+            t.start()
+            threads.append(t)
+
+        if not self.use_pool:
+            return start_thread
+        future_idx = self._future_idx
+
+        def submit(*args: T_ParamSpec.args, **kwargs: T_ParamSpec.kwargs) -> None:
+            # The runner may be created before entering the group,
+            # so look up the executor when it is called
+            if (executor := self._executor) is None:
+                start_thread(*args, **kwargs)
             else:
-                t = StoredThread(target=func, args=args, kwargs=kwargs)
-                t.start()
-                self._threads.append(t)
+                future_idx[executor.submit(func, *args, **kwargs)] = len(future_idx)
 
-        return runner
+        return submit
 
     def __exit__(self, *args, **kwargs):
         if fs := self._future_idx:
@@ -116,17 +125,23 @@ class ThreadGroup(AbstractContextManager):
                     res = exc
                 self._results[idx] = res
         else:
-            for t in self._threads:
+            threads = self._threads
+            for t in threads:
                 t.join(timeout=self._timeout)
-            for t in self._threads:
-                if t.is_alive():
-                    fn, gs, kw = t._target, t._args, t._kwargs  # type:ignore[attr-defined]
-                    if len(msg := f"{fn}(*{gs!r}, **{kw!r})") > 50:
-                        msg = msg[:47] + "..."
-                    res = TimeoutError(msg)
-                else:
-                    res = t._result
-                self._results.append(res)
+            # Collect after all joins, so that a thread which finished while
+            # waiting for the others is not reported as timeout
+            self._results = [self._thread_result(t) for t in threads]
+
+    @staticmethod
+    def _thread_result(t: StoredThread) -> Any:
+        if not t.is_alive():
+            return t._result
+        fn, gs, kw = t._target, t._args, t._kwargs  # type:ignore[attr-defined]
+        # Use reprlib to avoid building a huge string for large arguments
+        name = getattr(fn, "__qualname__", fn)
+        if len(msg := f"{name}(*{reprlib.repr(gs)}, **{reprlib.repr(kw)})") > 50:
+            msg = msg[:47] + "..."
+        return TimeoutError(msg)
 
 
 def _test() -> None:  # pragma: no cover
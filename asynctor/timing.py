@@ -66,16 +66,17 @@ class Timer(AbstractContextManager, AbstractAsyncContextManager):
             func = message
             self.__name__ = message = func.__name__
             self.func: Callable = func
+            self._is_coro = inspect.iscoroutinefunction(func)
         self.message = message
         self._decimal_places = decimal_places
-        self._end = self._start = time.time()
+        self._end = self._start = time.perf_counter()
         self._verbose = verbose
 
     def start(self) -> None:
-        self._start = time.time()
+        self._start = time.perf_counter()
 
     def capture(self, verbose=None) -> None:
-        self._end = time.time()
+        self._end = time.perf_counter()
         if verbose is None:
             verbose = self._verbose
         if verbose:
@@ -111,16 +112,14 @@ class Timer(AbstractContextManager, AbstractAsyncContextManager):
             self.capture()
 
     def _recreate_cm(self) -> "Self":
-        return self.__class__(
-            getattr(self, "func", None) or self.message,
-            self._decimal_places,
-            self._verbose,
-        )
+        # Each call gets its own timer so that concurrent calls do not share state,
+        # pass the message rather than the function to skip the decorator setup.
+        return self.__class__(self.message, self._decimal_places, self._verbose)
 
     def __call__(self, *args, **kwargs) -> Any:
         if (func := getattr(self, "func", None)) is None:
             return None
-        if inspect.iscoroutinefunction(func):
+        if self._is_coro:
 
             @functools.wraps(func)
             async def inner(*gs, **kw):
@@ -4,7 +4,7 @@ import functools
 import socket
 from collections.abc import AsyncGenerator, Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from asgi_lifespan import LifespanManager
@@ -170,15 +170,16 @@ class AttrDict(dict):
         True
     """
 
-    def __init__(self, *args, **kw) -> None:
-        super().__init__(*args, **kw)
-        exclude = set(dir(self)) | set(self.__dict__)
-        for k, v in self.items():
-            if not isinstance(k, str) or k in exclude:
-                continue
-            if isinstance(v, dict):
-                v = self.__class__(v)
-            self.__dict__.setdefault(k, v)
+    def __getattr__(self, name: str) -> Any:
+        # Only be called when normal lookup failed, so dict methods always take precedence
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if isinstance(value, dict) and not isinstance(value, AttrDict):
+            # Wrap nested dict on every access, so it always reflects the current value
+            return self.__class__(value)
+        return value
 
     def __str__(self) -> str:
         return super().__repr__()
@@ -187,9 +188,18 @@ class AttrDict(dict):
         return self.__class__.__name__ + "(" + super().__repr__() + ")"
 
 
+# Any private address works, as connecting a UDP socket sends no packet,
+# it doesn't even have to be reachable
+_IP_PROBE_ADDRESS = ("10.254.254.254", 1)
+# Only set after a successful probe, so that the fallback is detected again next time
+_machine_ip: str | None = None
+
+
 def get_machine_ip() -> str:
     r"""Get IP of current machine by socket, if failed, return '127.0.0.1'
 
+    A successful result is cached, while the fallback is not.
+
     Usage::
         >>> import re
         >>> my_ip = get_machine_ip()
@@ -201,14 +211,16 @@ def get_machine_ip() -> str:
         >>> sum(map(lambda x: 0 <= int(x) <= 255, inets))
         4
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-        s.settimeout(0)
-        try:
-            # doesn't even have to be reachable
-            s.connect(("10.254.254.254", 1))
-            return s.getsockname()[0]
-        except Exception:
-            return "127.0.0.1"
+    global _machine_ip
+    if _machine_ip is None:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0)
+            try:
+                s.connect(_IP_PROBE_ADDRESS)
+                _machine_ip = s.getsockname()[0]
+            except Exception:
+                return "127.0.0.1"
+    return _machine_ip
 
 
 def cache_attr(func: Callable[..., T]) -> Callable[..., T]:
@@ -1,30 +1,37 @@
 from __future__ import annotations
 
+import functools
+from importlib.util import find_spec
 from io import BytesIO
 from pathlib import Path
 from typing import Union
 
 import anyio
+import anyio.to_thread
 import pandas as pd
 
 FilePathType = Union[str, Path, anyio.Path]
+# Let `read_excel` use the much faster calamine engine if python-calamine is installed
+_DEFAULT_ENGINE = "calamine" if find_spec("python_calamine") is not None else None
 
 
 async def read_excel(file: FilePathType | bytes, as_str=False, **kw) -> pd.DataFrame:
     """Read excel from local file or bytes
 
     :param as_str: whether to read as dtype=str
-    :param kw: other kwargs that will pass to the `pd.read_excel` function
+    :param kw: other kwargs that will pass to the `pd.read_excel` function,
+        engine defaults to 'calamine' if python-calamine is installed
     """
     if isinstance(file, anyio.Path):
         file = await file.read_bytes()
     if as_str and "dtype" not in kw:
         kw.setdefault("dtype", str)
     kw.setdefault("keep_default_na", False)
-    if isinstance(file, bytes):
-        return pd.read_excel(BytesIO(file), **kw)
-    else:
-        return pd.read_excel(file, **kw)
+    if _DEFAULT_ENGINE is not None:
+        kw.setdefault("engine", _DEFAULT_ENGINE)
+    io = BytesIO(file) if isinstance(file, bytes) else file
+    # Parsing excel is blocking, so run it in a worker thread to keep the event loop free
+    return await anyio.to_thread.run_sync(functools.partial(pd.read_excel, io, **kw))
 
 
 def df_to_datas(df: pd.DataFrame) -> list[dict]:
@@ -1,13 +1,24 @@
 import asyncio
 import functools
+import math
+import time
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any
 
 import anyio
 import pytest
 
-from asynctor.aio import bulk_gather, gather, run, run_async, start_tasks, wait_for
+from asynctor.aio import (
+    bulk_gather,
+    gather,
+    map_group,
+    run,
+    run_async,
+    start_tasks,
+    wait_for,
+)
 from asynctor.exceptions import ParamsError
 from asynctor.timing import Timer
 
@@ -39,6 +50,30 @@ def test_run():
     assert run(foo, 2, backend="asyncio", backend_options=None) == 2
 
 
+def test_run_use_uvloop(mocker):
+    async def foo():
+        return 1
+
+    mocker.patch("asynctor.aio._USE_UVLOOP", True)
+    mocked = mocker.patch("anyio.run")
+    run(foo)
+    mocked.assert_called_once_with(
+        foo, backend="asyncio", backend_options={"use_uvloop": True}
+    )
+    mocked.reset_mock()
+    run(foo, backend_options={"debug": True})
+    mocked.assert_called_once_with(
+        foo, backend="asyncio", backend_options={"debug": True}
+    )
+    mocked.reset_mock()
+    run(foo, backend="trio")
+    mocked.assert_called_once_with(foo, backend="trio", backend_options=None)
+    mocked.reset_mock()
+    mocker.patch("asynctor.aio._USE_UVLOOP", False)
+    run(foo)
+    mocked.assert_called_once_with(foo, backend="asyncio", backend_options=None)
+
+
 @pytest.mark.anyio
 async def test_wait_for():
     async def do_sth(seconds=0.2):
@@ -48,6 +83,8 @@ async def test_wait_for():
     assert (await wait_for(do_sth(), 1)) == 0.2
     with pytest.raises(TimeoutError):
         await wait_for(do_sth(), 0.1)
+    assert (await wait_for(do_sth(0.1), None)) == 0.1
+    assert (await wait_for(do_sth(0.1), math.inf)) == 0.1
 
 
 class MockServer:
@@ -111,6 +148,29 @@ class TestGather:
             err_anyio = e
         assert self.is_the_same_error(err_asyncio, err_anyio)
 
+    @pytest.mark.anyio
+    async def test_gather_one(self):
+        async def a():
+            return 1
+
+        assert (await gather(a())) == (1,)
+        assert (await bulk_gather([a()], batch_size=2)) == (1,)
+        assert (await bulk_gather({a()})) == (1,)
+        assert (await bulk_gather({a(): 0}.keys())) == (1,)
+        with pytest.raises(ValueError):
+            await gather(self.raise_error_later(0, ValueError))
+        coros = [self.raise_error_later(0, ValueError)]
+        assert (await bulk_gather(coros, raises=False)) == (None,)
+        # Run in its own task like many coroutines, context changes do not leak
+        var: ContextVar[int] = ContextVar("var", default=0)
+
+        async def set_var():
+            var.set(1)
+            return var.get()
+
+        assert (await gather(set_var())) == (1,)
+        assert var.get() == 0
+
     @pytest.mark.anyio
     async def test_gather_without_raise(self):
         results = await bulk_gather(self.create_coros_for_raise(), raises=False)
@@ -125,7 +185,8 @@ class TestGather:
             assert sum(i == MockServer.OK for i in results) == total
         with Timer("Without sema:"):
             tasks = [MockServer.response() for _ in range(total)]
-            results = await bulk_gather(tasks, MockServer.limit, wait_last=True)
+            with pytest.deprecated_call():
+                results = await bulk_gather(tasks, MockServer.limit, wait_last=True)
             assert all(i == MockServer.OK for i in results)
         with Timer("All start:"):
             tasks = [MockServer.response() for _ in range(total)]
@@ -141,11 +202,27 @@ class TestGather:
             assert sum(i == MockServer.OK for i in results) == total
         with Timer("Without sema:"):
             tasks = [MockServer.response() for _ in range(total)]
-            results = await bulk_gather(
-                tasks, batch_size=MockServer.limit, wait_last=True
-            )
+            with pytest.deprecated_call():
+                results = await bulk_gather(
+                    tasks, batch_size=MockServer.limit, wait_last=True
+                )
             assert all(i == MockServer.OK for i in results)
 
+    @pytest.mark.anyio
+    async def test_bulk_wait_last_pool(self):
+        async def delay(seconds):
+            await anyio.sleep(seconds)
+            return seconds
+
+        seconds = [0.3, 0.1, 0.1, 0.1]
+        start = time.time()
+        with pytest.deprecated_call():
+            results = await bulk_gather([delay(i) for i in seconds], 2, wait_last=True)
+        end = time.time()
+        assert results == tuple(seconds)
+        # The slow one should not block the others
+        assert round(end - start, 1) == 0.3
+
     @pytest.mark.anyio
     async def test_bulk_batch_size_generator(self):
         total = 200
@@ -155,9 +232,10 @@ class TestGather:
             assert sum(i == MockServer.OK for i in results) == total
         with Timer("Without sema(generator):"):
             tasks = (MockServer.response() for _ in range(total))
-            results = await bulk_gather(
-                tasks, batch_size=MockServer.limit, wait_last=True
-            )
+            with pytest.deprecated_call():
+                results = await bulk_gather(
+                    tasks, batch_size=MockServer.limit, wait_last=True
+                )
             assert all(i == MockServer.OK for i in results)
 
     @pytest.mark.anyio
@@ -169,7 +247,10 @@ class TestGather:
             assert sum(i == MockServer.OK for i in results) == total
         with Timer("Without sema:"):
             tasks = [MockServer.response() for _ in range(total)]
-            results = await bulk_gather(tasks, limit=MockServer.limit, wait_last=True)
+            with pytest.deprecated_call():
+                results = await bulk_gather(
+                    tasks, limit=MockServer.limit, wait_last=True
+                )
             assert all(i == MockServer.OK for i in results)
 
     @pytest.mark.anyio
@@ -181,7 +262,10 @@ class TestGather:
             assert sum(i == MockServer.OK for i in results) == total
         with Timer("Without sema(generator):"):
             tasks = (MockServer.response() for _ in range(total))
-            results = await bulk_gather(tasks, limit=MockServer.limit, wait_last=True)
+            with pytest.deprecated_call():
+                results = await bulk_gather(
+                    tasks, limit=MockServer.limit, wait_last=True
+                )
             assert all(i == MockServer.OK for i in results)
 
     @pytest.mark.anyio
@@ -203,6 +287,25 @@ class TestGather:
 
         lazy_tasks = (a() for _ in range(3))
         assert (await bulk_gather(lazy_tasks)) == (1, 1, 1)
+        assert (await bulk_gather(a() for _ in range(0))) == ()
+
+
+@pytest.mark.anyio
+async def test_map_group():
+    values: list[int] = []
+
+    async def append(a, b):
+        values.append(a + b)
+
+    results: list[None] = []
+    await map_group(append, [(1, 2), (3, 4)], results)
+    assert sorted(values) == [3, 7]
+    assert results == [None, None]
+    await map_group(append, ((i, i) for i in range(3)), results)
+    assert sorted(values) == [0, 2, 3, 4, 7]
+    assert results == [None] * 5
+    await map_group(append, [(0, 1)])
+    assert len(values) == 6
 
 
 class TestStartTasks:
@@ -253,3 +356,18 @@ class TestStartTasks:
 
         for name in names:
             assert not await root.joinpath(name).exists()
+
+    @pytest.mark.anyio
+    async def test_start_awaitables(self):
+        done = []
+
+        class Job:
+            def __await__(self):
+                return self.run().__await__()
+
+            async def run(self):
+                done.append(1)
+
+        async with start_tasks(Job(), self.remove_files()):
+            await anyio.sleep(0.01)
+        assert done == [1]
@@ -1,9 +1,11 @@
 import os
 
 import pytest
-from redis.asyncio import Redis
+from fastapi import FastAPI, Request
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from asynctor import AsyncRedis, AsyncTestClient
+from asynctor.client import _parse_max_connections
 
 from .main import app
 
@@ -49,3 +51,39 @@ def test_redis_host_port():
     custom_port = 8888
     redis = AsyncRedis(port=custom_port)
     assert redis.connection_pool.connection_kwargs["port"] == custom_port
+
+
+def test_redis_max_connections(mocker):
+    redis = AsyncRedis()
+    assert not isinstance(redis.connection_pool, BlockingConnectionPool)
+    mocker.patch("asynctor.client._REDIS_MAX_CONNECTIONS", 10)
+    redis = AsyncRedis("example.com", db=2)
+    assert isinstance(redis.connection_pool, BlockingConnectionPool)
+    assert redis.connection_pool.max_connections == 10
+    assert redis.connection_pool.connection_kwargs["host"] == "example.com"
+    assert redis.connection_pool.connection_kwargs["db"] == 2
+    redis = AsyncRedis(max_connections=5)
+    assert not isinstance(redis.connection_pool, BlockingConnectionPool)
+    assert redis.connection_pool.max_connections == 5
+
+
+def test_parse_max_connections():
+    assert _parse_max_connections(None) is None
+    assert _parse_max_connections("") is None
+    assert _parse_max_connections("32") == 32
+    for value in ("0", "-1", "abc", "1.5"):
+        with pytest.raises(ValueError, match="REDIS_MAX_CONNECTIONS"):
+            _parse_max_connections(value)
+
+
+def test_redis_from_app_state():
+    app = FastAPI()
+    redis = AsyncRedis(app, check_connection=False)
+    assert app.state.redis is redis
+    pool = redis.connection_pool
+    request = Request({"type": "http", "app": app})
+    assert AsyncRedis(request) is redis
+    assert redis.connection_pool is pool
+    assert redis._check_connection is False
+    # Objects without `state` are ignored
+    assert isinstance(AsyncRedis(object(), check_connection=False), AsyncRedis)
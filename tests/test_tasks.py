@@ -86,3 +86,15 @@ def test_thread_group_with_pool():
     assert round(end - start, 1) == 0.3
     assert tg.results[0] == 0.1
     assert tg.results[1] == 0.2
+
+
+def test_thread_group_soonify_before_enter():
+    tg = ThreadGroup(max_workers=1)
+    run = tg.soonify(sleep)
+    start = time.time()
+    with tg:
+        run(seconds=0.1)
+        run(seconds=0.2)
+    end = time.time()
+    assert round(end - start, 1) == 0.3
+    assert tg.results == [0.1, 0.2]
@@ -135,7 +135,7 @@ class TestTimer:
         # Manual capture
         clock = Timer("testing start capture", decimal_places=2, verbose=False)
         assert repr(clock) == "Timer('testing start capture', 2, False)"
-        start = time.time()
+        start = time.perf_counter()
         assert clock._start <= start
         time.sleep(0.5)
         clock.start()
@@ -4,7 +4,7 @@ from datetime import datetime
 
 import pytest
 
-from asynctor import AttrDict
+from asynctor import AttrDict, utils
 from asynctor.utils import AsyncTestClient, cache_attr, get_machine_ip
 
 from .main import app_default_to_mount_lifespan, app_for_utils_test
@@ -51,6 +51,20 @@ class TestAttrDict:
         assert str(d) == str(origin_dict)
         assert repr(d) == "AttrDict(" + repr(origin_dict) + ")"
 
+    def test_lazy_attrs(self):
+        d = AttrDict({"a": {"b": 1}})
+        assert d.a.b == 1
+        d["a"]["b"] = 5
+        assert d.a.b == 5
+        assert vars(d) == {}
+        d["c"] = 2
+        assert d.c == 2
+        d["a"] = {"b": 2}
+        assert d.a.b == 2
+        del d["a"]
+        with pytest.raises(AttributeError):
+            assert d.a
+
     def test_raises(self):
         with pytest.raises(AttributeError):
             assert AttrDict().a
@@ -113,7 +127,11 @@ def test_get_ip(mocker):
     assert len(nets) == 4
     assert all(0 <= int(i) <= 255 for i in nets)
     mocker.patch("socket.socket.getsockname", return_value=True)
+    assert get_machine_ip() == my_ip
+    mocker.patch("asynctor.utils._machine_ip", None)
     assert get_machine_ip() == "127.0.0.1"
+    # The fallback is not cached
+    assert utils._machine_ip is None
 
 
 def test_cache_attr():
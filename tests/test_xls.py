@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import anyio
+import pandas as pd
 import pytest
 
 from asynctor.xls import df_to_datas, load_xls, read_excel
@@ -24,3 +25,17 @@ async def test_read():
         {"Column1": "row1-\\t%c", "Column2\nMultiLines": "0", "Column 3": "1", 4: ""},
         {"Column1": "r2c1\n00", "Column2\nMultiLines": "r2 c2", "Column 3": "2", 4: ""},
     ]
+
+
+@pytest.mark.anyio
+async def test_default_engine(mocker):
+    demo = Path(__file__).parent / "demo.xlsx"
+    spy = mocker.spy(pd, "read_excel")
+    mocker.patch("asynctor.xls._DEFAULT_ENGINE", None)
+    await read_excel(demo)
+    assert "engine" not in spy.call_args.kwargs
+    mocker.patch("asynctor.xls._DEFAULT_ENGINE", "openpyxl")
+    await read_excel(demo)
+    assert spy.call_args.kwargs["engine"] == "openpyxl"
+    await read_excel(demo, engine=None)
+    assert spy.call_args.kwargs["engine"] is None